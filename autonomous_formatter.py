@@ -1,113 +1,30 @@
 import json
 import re
+import threading
 import tkinter as tk
+from functools import lru_cache
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 
-# ---------------- Conversion Logic ---------------- #
-
-def f(v):
-    """Formats floats like 85.7000 -> 85.7"""
-    if isinstance(v, (int, float)):
-        return f"{v:.3f}".rstrip("0").rstrip(".")
-    return str(v)
-
-def camel_case(s):
-    """Converts names like 'Prep_Artifacts_1' -> 'prepArtifacts1'"""
-    parts = re.split(r'[_\s]+', s)
-    return parts[0].lower() + "".join(p.capitalize() for p in parts[1:])
-
-def convert(json_data, class_name="Auto"):
-    start = json_data["startPoint"]
-    lines = json_data["lines"]
-
-    start_pose_name = "startPose"
-    start_pose_line = f'private final Pose {start_pose_name} = new Pose({f(start["x"])}, {f(start["y"])}, Math.toRadians({f(start.get("startDeg", 0))})); // Start position'
-
-    # Generate poses
-    poses = []
-    for line in lines:
-        name = camel_case(line["name"])
-        ep = line["endPoint"]
-        deg = ep.get("degrees", ep.get("endDeg", 0))
-        poses.append(f'private final Pose {name}Pose = new Pose({f(ep["x"])}, {f(ep["y"])}, Math.toRadians({f(deg)})); // {line["name"]}')
-
-    # Declare all PathChains in one line
-    path_names = [f'{camel_case(line["name"])}Path' for line in lines]
-    path_vars = f'private PathChain {", ".join(path_names)};'
+try:
+    # Optional: orjson parses large .pp files several times faster
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
+_CAMEL_SPLIT_RE = re.compile(r'[_\s]+')
 
-    # Build paths with multi-line formatting
-    build_lines = []
-    prev_pose = start_pose_name
-    for line in lines:
-        name = camel_case(line["name"])
-        end_pose = f"{name}Pose"
-        ep = line["endPoint"]
-        heading = ep.get("heading", "linear")
-        control_points = line["controlPoints"]
-
-        build = f'{name}Path = follower.pathBuilder()\n'
-
-        if len(control_points) == 0:
-            # Simple line
-            build += f'        .addPath(new BezierLine({prev_pose}, {end_pose}))\n'
-        else:
-            # Curve with control point
-            cp = control_points[0]
-            build += f'        .addPath(new BezierCurve(\n'
-            build += f'                {prev_pose},\n'
-            build += f'                new Pose({f(cp["x"])}, {f(cp["y"])}), // Control point\n'
-            build += f'                {end_pose}\n'
-            build += f'        ))\n'
-
-        # Set heading interpolation
-        if heading == "constant":
-            build += f'        .setConstantHeadingInterpolation({end_pose}.getHeading())\n'
-        else:
-            build += f'        .setLinearHeadingInterpolation({prev_pose}.getHeading(), {end_pose}.getHeading())\n'
-
-        build += '        .build();'
-        build_lines.append(build)
-        prev_pose = end_pose
-
-            # ---------------- State Machine Generator ---------------- #
-
-    update_lines = []
-    for i, line in enumerate(lines):
-        name = camel_case(line["name"]) + "Path"
-
-        if i == 0:
-            # First state — no isBusy check
-            update_lines.append(
-                f"case {i}:\n"
-                f"              follower.followPath({name});\n"
-                f"              setPathState({i+1});\n"
-                f"              break;"
-            )
-        else:
-            # States 1..N with isBusy()
-            update_lines.append(
-                f"case {i}:\n"
-                f"              if (!follower.isBusy()) {{\n"
-                f"                 follower.followPath({name});\n"
-                f"                 setPathState({i+1});\n"
-                f"              }}\n"
-                f"              break;"
-            )
-
-    # Add final do-nothing state
-    final_state = len(lines)
-    update_lines.append(
-        f"case {final_state}:\n"
-        f"              // Done\n"
-        f"              break;"
-    )
-
-    update_state_machine = "\n\n            ".join(update_lines)
+# Group names double as the Text widget tag names used by highlight_java
+_JAVA_TOKEN_RE = re.compile(
+    r"\b(?:(?P<keyword>class|public|private|void|if|else|while|for|return|switch|case|new|import|package|extends|implements|static|final)"
+    r"|(?P<class>Pose|Path|PathChain|BezierLine|BezierCurve|Follower|Timer|LinearOpMode))\b"
+    r'|(?P<string>"[^"]*")'
+    r"|(?P<comment>//[^\n]*)"
+)
 
+# ---------------- Conversion Logic ---------------- #
 
-    # Assemble the final Java code
-    code = f"""package org.firstinspires.ftc.teamcode.opModes.autonomous;
+# Java class skeleton filled in by convert(); literal braces are doubled
+_JAVA_TEMPLATE = """package org.firstinspires.ftc.teamcode.opModes.autonomous;
 import com.pedropathing.follower.Follower;
 import com.pedropathing.geometry.BezierCurve;
 import com.pedropathing.geometry.BezierLine;
@@ -142,12 +59,12 @@ public class {class_name} extends LinearOpMode {{
     {start_pose_line}
 
     // Trajectory Poses
-    {"\n    ".join(poses)}
+    {poses}
 
     {path_vars}
 
     public void buildPaths() {{
-        {"\n\n        ".join(build_lines)}
+        {build_paths}
     }}
 
     public void autonomousPathUpdate() {{
@@ -179,79 +96,296 @@ public class {class_name} extends LinearOpMode {{
     }}
 }}
 """
-    return code
 
+def f(v):
+    """Formats floats like 85.7000 -> 85.7"""
+    if type(v) in (float, int):
+        s = format(v, ".3f")
+        if s[-1] != "0":
+            return s
+        # Trim trailing zeros, then the dot if nothing is left after it
+        s = s.rstrip("0")
+        return s[:-1] if s[-1] == "." else s
+    return str(v)
 
+@lru_cache(maxsize=2048)
+def camel_case(s):
+    """Converts names like 'Prep_Artifacts_1' -> 'prepArtifacts1'"""
+    parts = _CAMEL_SPLIT_RE.split(s)
+    return parts[0].lower() + "".join(p.capitalize() for p in parts[1:])
 
-# ---------------- Syntax Highlighting ---------------- #
+# ---------------- Path Builder Blocks ---------------- #
 
-def highlight_java(text_widget):
-    text_widget.tag_remove("keyword", "1.0", tk.END)
-    text_widget.tag_remove("class", "1.0", tk.END)
-    text_widget.tag_remove("comment", "1.0", tk.END)
-    text_widget.tag_remove("string", "1.0", tk.END)
+def line_block(path_name, prev, end):
+    """Starts a pathBuilder() chain with a straight segment"""
+    return (
+        f"{path_name} = follower.pathBuilder()\n"
+        f"        .addPath(new BezierLine({prev}, {end}))\n"
+    )
 
-    java_keywords = r"\b(class|public|private|void|if|else|while|for|return|switch|case|new|import|package|extends|implements|static|final)\b"
-    classes = r"\b(Pose|Path|PathChain|BezierLine|BezierCurve|Follower|Timer|LinearOpMode)\b"
+def curve_block(path_name, prev, cpx, cpy, end):
+    """Starts a pathBuilder() chain with a single control point curve"""
+    return (
+        f"{path_name} = follower.pathBuilder()\n"
+        f"        .addPath(new BezierCurve(\n"
+        f"                {prev},\n"
+        f"                new Pose({cpx}, {cpy}), // Control point\n"
+        f"                {end}\n"
+        f"        ))\n"
+    )
 
-    code = text_widget.get("1.0", tk.END)
+def constant_heading(end):
+    return f"        .setConstantHeadingInterpolation({end}.getHeading())\n"
+
+def linear_heading(prev, end):
+    return f"        .setLinearHeadingInterpolation({prev}.getHeading(), {end}.getHeading())\n"
+
+# ---------------- State Machine Generator ---------------- #
+
+def state_case(i, path_name):
+    """Returns the autonomousPathUpdate() case that follows path i"""
+    if i == 0:
+        # First state — no isBusy check
+        return (
+            f"case {i}:\n"
+            f"              follower.followPath({path_name});\n"
+            f"              setPathState({i+1});\n"
+            f"              break;"
+        )
+    # States 1..N with isBusy()
+    return (
+        f"case {i}:\n"
+        f"              if (!follower.isBusy()) {{\n"
+        f"                 follower.followPath({path_name});\n"
+        f"                 setPathState({i+1});\n"
+        f"              }}\n"
+        f"              break;"
+    )
 
-    for match in re.finditer(java_keywords, code):
-        start, end = match.span()
-        text_widget.tag_add("keyword", f"1.0+{start}c", f"1.0+{end}c")
+def convert(json_data, class_name="Auto"):
+    # Local aliases for the per-line loop below
+    _f = f
+    _camel = camel_case
+    _line_block = line_block
+    _curve_block = curve_block
+    _constant_heading = constant_heading
+    _linear_heading = linear_heading
+    _state_case = state_case
+    start = json_data["startPoint"]
+    lines = json_data["lines"]
 
-    for match in re.finditer(classes, code):
-        start, end = match.span()
-        text_widget.tag_add("class", f"1.0+{start}c", f"1.0+{end}c")
+    start_pose_name = "startPose"
+    start_pose_line = f'private final Pose {start_pose_name} = new Pose({_f(start["x"])}, {_f(start["y"])}, Math.toRadians({_f(start.get("startDeg", 0))})); // Start position'
 
-    for match in re.finditer(r'"[^"]*"', code):
-        start, end = match.span()
-        text_widget.tag_add("string", f"1.0+{start}c", f"1.0+{end}c")
+    pose_rows = []
+    path_names = []
+    build_lines = []
+    update_lines = []
+    _pose_rows_append = pose_rows.append
+    _path_names_append = path_names.append
+    _build_append = build_lines.append
+    _update_append = update_lines.append
 
-    for match in re.finditer(r"//[^\n]*", code):
-        start, end = match.span()
-        text_widget.tag_add("comment", f"1.0+{start}c", f"1.0+{end}c")
+    # Poses, PathChain names, path builders and states in a single pass
+    prev_pose = start_pose_name
+    for i, line in enumerate(lines):
+        raw_name = line["name"]
+        name = _camel(raw_name)
+        end_pose = f"{name}Pose"
+        path_name = f"{name}Path"
+        ep = line["endPoint"]
+        heading = ep.get("heading", "linear")
+        control_points = line["controlPoints"]
+
+        epx = _f(ep["x"])
+        epy = _f(ep["y"])
+        deg = _f(ep["degrees"] if "degrees" in ep else ep.get("endDeg", 0))
+        _pose_rows_append((name, epx, epy, deg, raw_name))
+        _path_names_append(path_name)
+
+        # Build paths with multi-line formatting
+        if control_points:
+            # Curve with control point
+            cp = control_points[0]
+            path = _curve_block(path_name, prev_pose, _f(cp["x"]), _f(cp["y"]), end_pose)
+        else:
+            # Simple line
+            path = _line_block(path_name, prev_pose, end_pose)
+
+        # Set heading interpolation
+        if heading == "constant":
+            path += _constant_heading(end_pose)
+        else:
+            path += _linear_heading(prev_pose, end_pose)
+
+        _build_append(path + "        .build();")
 
+        _update_append(_state_case(i, path_name))
+        prev_pose = end_pose
+
+    # Declare all PathChains in one line
+    path_vars = f'private PathChain {", ".join(path_names)};'
+
+    # Add final do-nothing state
+    final_state = len(lines)
+    update_lines.append(
+        f"case {final_state}:\n"
+        f"              // Done\n"
+        f"              break;"
+    )
+
+    update_state_machine = "\n\n            ".join(update_lines)
+
+
+    # Assemble the final Java code
+    return _JAVA_TEMPLATE.format(
+        class_name=class_name,
+        start_pose_line=start_pose_line,
+        poses="\n    ".join(
+            "private final Pose %sPose = new Pose(%s, %s, Math.toRadians(%s)); // %s" % row
+            for row in pose_rows
+        ),
+        path_vars=path_vars,
+        build_paths="\n\n        ".join(build_lines),
+        update_state_machine=update_state_machine,
+    )
+
+
+
+# ---------------- Syntax Highlighting ---------------- #
+
+def configure_java_tags(text_widget):
+    """Sets up the highlight tag colors; call once when the widget is created"""
     text_widget.tag_config("keyword", foreground="#569CD6")
     text_widget.tag_config("class", foreground="#4EC9B0")
     text_widget.tag_config("string", foreground="#CE9178")
     text_widget.tag_config("comment", foreground="#6A9955", font=("Consolas", 10, "italic"))
 
+def highlight_java(text_widget, start_idx="1.0", end_idx=tk.END):
+    start_idx = text_widget.index(start_idx)
+
+    text_widget.tag_remove("keyword", start_idx, end_idx)
+    text_widget.tag_remove("class", start_idx, end_idx)
+    text_widget.tag_remove("comment", start_idx, end_idx)
+    text_widget.tag_remove("string", start_idx, end_idx)
+
+    code = text_widget.get(start_idx, end_idx)
+
+    spans = {"keyword": [], "class": [], "string": [], "comment": []}
+
+    for match in _JAVA_TOKEN_RE.finditer(code):
+        start, end = match.span()
+        spans[match.lastgroup] += (f"{start_idx}+{start}c", f"{start_idx}+{end}c")
+
+    # One tag_add per tag: Tk accepts any number of start/end index pairs
+    for tag, indices in spans.items():
+        if indices:
+            text_widget.tag_add(tag, *indices)
+
+def highlight_viewport(text_widget):
+    """Highlights only the lines currently visible in text_widget"""
+    start_idx = text_widget.index("@0,0 linestart")
+    end_idx = text_widget.index(f"@0,{text_widget.winfo_height()} lineend")
+    highlight_java(text_widget, start_idx, end_idx)
+
 # ---------------- GUI ---------------- #
 
+INSERT_CHUNK_CHARS = 64 * 1024
+SAVE_CHUNK_LINES = 4096
+HIGHLIGHT_DELAY_MS = 50
+GENERATE_POLL_MS = 20
+
+_pending_highlight = None
+
 def select_json():
     filename = filedialog.askopenfilename(filetypes=[(".pp Files", "*.pp")])
     if filename:
         entry_json_path.delete(0, tk.END)
         entry_json_path.insert(0, filename)
 
+def load_and_convert(json_path, class_name, result):
+    """Worker thread body: reads and converts the .pp file into result"""
+    try:
+        with open(json_path, "rb", buffering=1 << 20) as f:
+            data = _json_loads(f.read())
+        result["code"] = convert(data, class_name)
+    except Exception as e:
+        result["error"] = e
+
 def generate_code():
     json_path = entry_json_path.get()
     class_name = entry_class_name.get() or "Autonomoous"
     if not json_path:
         messagebox.showerror("Error", "Please select a .pp file first.")
         return
-    try:
-        with open(json_path, "r") as f:
-            data = json.load(f)
-        java_code = convert(data, class_name)
-        text_output.delete(1.0, tk.END)
-        text_output.insert(tk.END, java_code)
-        highlight_java(text_output)
-        messagebox.showinfo("Success", f"Java code generated for class {class_name}!")
-    except Exception as e:
-        messagebox.showerror("Error", f"Failed to generate code:\n{e}")
+    # Parse and convert off the Tk thread so the window stays responsive
+    result = {}
+    worker = threading.Thread(target=load_and_convert, args=(json_path, class_name, result), daemon=True)
+    worker.start()
+    status_label.config(text="Generating...")
+    root.after(GENERATE_POLL_MS, finish_generate, worker, result, class_name)
+
+def finish_generate(worker, result, class_name):
+    if worker.is_alive():
+        root.after(GENERATE_POLL_MS, finish_generate, worker, result, class_name)
+        return
+    if "error" in result:
+        status_label.config(text="")
+        messagebox.showerror("Error", f"Failed to generate code:\n{result['error']}")
+        return
+    java_code = result["code"]
+    text_output.delete(1.0, tk.END)
+    # Insert in slices so Tk can lay out and repaint between them
+    for i in range(0, len(java_code), INSERT_CHUNK_CHARS):
+        text_output.insert(tk.END, java_code[i:i + INSERT_CHUNK_CHARS])
+        root.update_idletasks()
+    schedule_highlight(idle=True)
+    status_label.config(text=f"Java code generated for class {class_name}!")
+
+def run_highlight():
+    global _pending_highlight
+    _pending_highlight = None
+    highlight_viewport(text_output)
+
+def schedule_highlight(idle=False):
+    """Debounces highlighting: each call replaces any highlight still pending"""
+    global _pending_highlight
+    if _pending_highlight is not None:
+        text_output.after_cancel(_pending_highlight)
+    if idle:
+        _pending_highlight = text_output.after_idle(run_highlight)
+    else:
+        _pending_highlight = text_output.after(HIGHLIGHT_DELAY_MS, run_highlight)
+
+def on_output_modified(event):
+    # <<Modified>> only fires again once the flag is cleared
+    text_output.edit_modified(False)
+    schedule_highlight()
+
+def on_output_scroll(first, last):
+    text_output.vbar.set(first, last)
+    schedule_highlight()
 
 def save_file():
-    code = text_output.get(1.0, tk.END).strip()
-    if not code:
+    # Bounds of the output with surrounding whitespace trimmed, like str.strip()
+    first = text_output.search(r"\S", "1.0", tk.END, regexp=True)
+    if not first:
         messagebox.showerror("Error", "No code to save. Generate first!")
         return
+    last = text_output.search(r"\S", tk.END, "1.0", backwards=True, regexp=True)
     filename = filedialog.asksaveasfilename(defaultextension=".java", filetypes=[("Java Files", "*.java")])
     if filename:
-        with open(filename, "w") as f:
-            f.write(code)
-        messagebox.showinfo("Saved", f"Java file saved as:\n{filename}")
+        end = text_output.index(f"{last}+1c")
+        first_line = int(first.split(".")[0])
+        end_line = int(end.split(".")[0])
+        with open(filename, "w", buffering=1 << 20, encoding="utf-8", newline="") as f:
+            # Copy out of the widget a slice of lines at a time
+            for line in range(first_line, end_line + 1, SAVE_CHUNK_LINES):
+                chunk_start = first if line == first_line else f"{line}.0"
+                next_line = line + SAVE_CHUNK_LINES
+                chunk_end = f"{next_line}.0" if next_line <= end_line else end
+                f.write(text_output.get(chunk_start, chunk_end))
+        status_label.config(text=f"Java file saved as: {filename}")
 
 # ---------------- Tkinter UI ---------------- #
 
@@ -295,7 +429,14 @@ text_output = scrolledtext.ScrolledText(root, width=120, height=30,
                                         insertbackground="white",
                                         font=("Consolas", 10))
 text_output.pack(padx=10, pady=10)
+configure_java_tags(text_output)
+# Re-highlight whatever scrolls into view, however the view was moved
+text_output.configure(yscrollcommand=on_output_scroll)
+text_output.bind("<<Modified>>", on_output_modified)
 
 ttk.Button(root, text="💾 Save as .java", command=save_file, style="Dark.TButton").pack(pady=5)
 
+status_label = tk.Label(root, text="", fg="white", bg="#1e1e1e")
+status_label.pack(pady=5)
+
 root.mainloop()